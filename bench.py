@@ -0,0 +1,264 @@
+#!/usr/bin/env python
+"""
+Endpoint benchmark for SkinCare AI.
+
+Creates a throwaway test database, seeds it with a benchmark user plus realistic
+tracker, routine, chat and article volumes, then requests each major page repeatedly
+and reports p50/p95/p99 latency, SQL queries per request and peak Python memory.
+Latency is timed without instrumentation; queries and memory come from a separate
+pass. Results can be saved as a baseline JSON and later runs compared against it;
+the script exits non-zero when an endpoint returns a non-200 status, is missing, or
+regresses against the baseline.
+
+Usage:
+    python bench.py [--iterations 50] [--days 365] [--routines 10] [--messages 200] [--articles 50]
+    python bench.py --save-baseline bench_baseline.json
+    python bench.py --baseline bench_baseline.json [--tolerance 0.25]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tracemalloc
+import django
+
+# Setup Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'skincare_ai.settings')
+django.setup()
+
+from datetime import date, timedelta
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, setup_test_environment, teardown_test_environment
+from django.utils.text import slugify
+
+from articles.models import Article, ArticleCategory, UserFavorite
+from tracker.models import ProgressEntry, SkinMetric
+from routines.models import Routine, RoutineStep
+from chatbot.models import ChatSession, ChatMessage
+from tracker_history import METRIC_UNITS, positive_int
+
+BENCH_USERNAME = 'bench_user'
+INSTRUMENTED_REQUESTS = 5
+
+ENDPOINTS = [
+    ('home', '/'),
+    ('profile', '/profile/'),
+    ('quiz', '/quiz/'),
+    ('routines', '/routines/'),
+    ('tracker', '/tracker/'),
+    ('articles', '/articles/'),
+    ('chatbot', '/chatbot/'),
+]
+
+
+def seed_data(days, routines, messages, articles):
+    """Create the benchmark user and its data in the test database. Returns the user."""
+    User = get_user_model()
+    user = User.objects.create_user(
+        username=BENCH_USERNAME,
+        email='bench@example.com',
+        password='benchpass123',
+        skin_type='combination',
+        age=29,
+    )
+
+    rng = random.Random(42)
+    today = date.today()
+    entries = ProgressEntry.objects.bulk_create([
+        ProgressEntry(user=user, date=today - timedelta(days=n), skin_condition='improved',
+                      notes=f'Benchmark entry {n}')
+        for n in range(days)
+    ], batch_size=500)
+    SkinMetric.objects.bulk_create([
+        SkinMetric(entry=entry, metric_type=metric_type, value=rng.randint(1, 10), unit=unit)
+        for entry in entries
+        for metric_type, unit in METRIC_UNITS.items()
+    ], batch_size=2000)
+
+    for n in range(routines):
+        steps = [
+            {
+                'step_number': i,
+                'step_name': f'Шаг {i}',
+                'product': f'Продукт {i}',
+                'instructions': 'Нанести на чистую кожу.',
+                'duration_minutes': rng.randint(1, 5),
+            }
+            for i in range(1, rng.randint(3, 8) + 1)
+        ]
+        routine = Routine.objects.create(
+            user=user,
+            name=f'Benchmark routine {n}',
+            routine_type=rng.choice(['morning', 'evening', 'weekly']),
+            is_ai_generated=False,
+            products=[step['product'] for step in steps],
+            steps=steps,
+        )
+        RoutineStep.objects.bulk_create([
+            RoutineStep(routine=routine, step_number=step['step_number'], step_name=step['step_name'],
+                        product=step['product'], instructions=step['instructions'],
+                        duration_minutes=step['duration_minutes'])
+            for step in steps
+        ])
+
+    session = ChatSession.objects.create(user=user, session_id=f'bench-{user.pk}', title='Benchmark')
+    ChatMessage.objects.bulk_create([
+        ChatMessage(session=session, message_type='user' if n % 2 == 0 else 'bot',
+                    content=f'Benchmark message {n}')
+        for n in range(messages)
+    ], batch_size=1000)
+
+    categories = ArticleCategory.objects.bulk_create([
+        ArticleCategory(name=f'Категория {n}', description='Статьи для бенчмарка')
+        for n in range(5)
+    ])
+    created = Article.objects.bulk_create([
+        Article(
+            title=f'Статья {n}',
+            slug=slugify(f'bench-article-{n}'),
+            content='Уход за кожей. ' * 300,
+            excerpt='Краткое описание статьи.',
+            category=categories[n % len(categories)],
+            author=user,
+            is_featured=n < 3,
+            view_count=rng.randint(0, 5000),
+        )
+        for n in range(articles)
+    ], batch_size=500)
+    UserFavorite.objects.bulk_create([
+        UserFavorite(user=user, article=article) for article in created[:10]
+    ])
+
+    return user
+
+
+def percentile(sorted_values, pct):
+    index = max(int(round(pct / 100 * len(sorted_values))) - 1, 0)
+    return sorted_values[index]
+
+
+def bench_endpoint(client, url, iterations):
+    """Request url iterations times after one warmup; return latency/query/memory stats."""
+    statuses = {client.get(url).status_code}
+
+    # Timed pass: no query capture or allocation tracing, so latencies are real
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        response = client.get(url)
+        latencies.append((time.perf_counter() - start) * 1000)
+        statuses.add(response.status_code)
+
+    # Instrumented pass for query counts and peak memory
+    queries = []
+    tracemalloc.start()
+    for _ in range(INSTRUMENTED_REQUESTS):
+        with CaptureQueriesContext(connection) as ctx:
+            statuses.add(client.get(url).status_code)
+        queries.append(len(ctx.captured_queries))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Report the worst status seen: any non-200 response must fail the run
+    failed = sorted(status for status in statuses if status != 200)
+    latencies.sort()
+    return {
+        'status': failed[0] if failed else 200,
+        'p50_ms': round(percentile(latencies, 50), 2),
+        'p95_ms': round(percentile(latencies, 95), 2),
+        'p99_ms': round(percentile(latencies, 99), 2),
+        'queries': max(queries),
+        'peak_kb': round(peak / 1024, 1),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Return a list of regression messages against the baseline results."""
+    regressions = [f"{name}: missing from results" for name in baseline if name not in results]
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if result['status'] != base['status']:
+            regressions.append(f"{name}: status {result['status']} != baseline {base['status']}")
+        if result['p95_ms'] > base['p95_ms'] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {result['p95_ms']} ms > baseline {base['p95_ms']} ms")
+        if result['queries'] > base['queries']:
+            regressions.append(f"{name}: {result['queries']} queries > baseline {base['queries']}")
+        if result['peak_kb'] > base['peak_kb'] * (1 + tolerance):
+            regressions.append(f"{name}: peak {result['peak_kb']} KB > baseline {base['peak_kb']} KB")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SkinCare AI endpoints")
+    parser.add_argument('--iterations', type=positive_int, default=50)
+    parser.add_argument('--days', type=int, default=365, help="Tracker entries to seed")
+    parser.add_argument('--routines', type=int, default=10)
+    parser.add_argument('--messages', type=int, default=200, help="Chat messages to seed")
+    parser.add_argument('--articles', type=int, default=50, help="Articles to seed")
+    parser.add_argument('--baseline', help="Baseline JSON to compare against")
+    parser.add_argument('--save-baseline', help="Write results to this JSON file")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="Allowed p95/memory growth")
+    args = parser.parse_args()
+
+    # Work in a throwaway test database so real data is never touched or relied on;
+    # DEBUG stays off to keep its overhead out of the numbers
+    setup_test_environment(debug=False)
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+
+    try:
+        print("🧪 Seeding benchmark data...")
+        user = seed_data(args.days, args.routines, args.messages, args.articles)
+
+        client = Client()
+        client.force_login(user)
+
+        print(f"\n{'endpoint':<12}{'status':>7}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'queries':>9}{'peak KB':>10}")
+        results = {}
+        for name, url in ENDPOINTS:
+            result = bench_endpoint(client, url, args.iterations)
+            results[name] = result
+            print(f"{name:<12}{result['status']:>7}{result['p50_ms']:>9}{result['p95_ms']:>9}"
+                  f"{result['p99_ms']:>9}{result['queries']:>9}{result['peak_kb']:>10}")
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+    failures = [f"{name}: status {result['status']}" for name, result in results.items()
+                if result['status'] != 200]
+    if failures:
+        print("\n❌ Endpoints with non-200 responses:")
+        for failure in failures:
+            print(f"  - {failure}")
+
+    if args.save_baseline:
+        if failures:
+            print("\n❌ Baseline not saved: some endpoints did not return 200")
+        else:
+            with open(args.save_baseline, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2)
+            print(f"\n✅ Baseline saved to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print("\n❌ Regressions found:")
+            for regression in regressions:
+                print(f"  - {regression}")
+        else:
+            print("\n✅ No regressions against baseline")
+        failures += regressions
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
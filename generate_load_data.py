@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+"""
+Generate large volumes of synthetic data for load and scaling tests.
+
+Creates users with realistic skin profiles plus their tracker entries and metrics,
+quiz results, routines, chat sessions/messages and article favorites. Users are
+processed in chunks and every table is filled with batched bulk_create inserts,
+so memory stays bounded and generation runs at tens of thousands of rows per second.
+
+Usage:
+    python generate_load_data.py [--users 10000] [--chunk-size 1000] [--seed 42]
+        [--entries 60] [--messages 20] [--routines 2] [--favorites 3]
+
+--entries/--messages/--routines/--favorites are per-user means; actual counts vary per user.
+"""
+
+import os
+import time
+import random
+import argparse
+import django
+
+# Setup Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'skincare_ai.settings')
+django.setup()
+
+from datetime import date, timedelta
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+
+from articles.models import Article, UserFavorite
+from chatbot.models import ChatSession, ChatMessage
+from quiz.models import QuizResult
+from routines.models import Routine, RoutineStep
+from tracker.models import ProgressEntry, SkinMetric
+from tracker_history import METRIC_UNITS, positive_int
+
+BATCH_SIZE = 5000
+
+SKIN_TYPES = ['normal', 'dry', 'oily', 'combination', 'sensitive']
+SKIN_TYPE_WEIGHTS = [20, 22, 18, 30, 10]
+CONCERNS = ['акне', 'сухость', 'покраснение', 'морщины', 'расширенные поры', 'пигментация']
+LIFESTYLES = ['активный', 'офисная работа', 'много путешествий', 'студент', 'ночные смены']
+SKIN_CONDITIONS = ['improved', 'same', 'worse']
+SKIN_CONDITION_WEIGHTS = [50, 35, 15]
+
+# Baseline metric levels per skin type; daily values drift around these
+METRIC_BASELINES = {
+    'normal': {'hydration': 6, 'oiliness': 4, 'redness': 2, 'acne': 2, 'wrinkles': 3, 'pores': 3},
+    'dry': {'hydration': 3, 'oiliness': 2, 'redness': 4, 'acne': 2, 'wrinkles': 4, 'pores': 2},
+    'oily': {'hydration': 5, 'oiliness': 8, 'redness': 3, 'acne': 6, 'wrinkles': 2, 'pores': 7},
+    'combination': {'hydration': 5, 'oiliness': 6, 'redness': 3, 'acne': 4, 'wrinkles': 3, 'pores': 5},
+    'sensitive': {'hydration': 4, 'oiliness': 3, 'redness': 7, 'acne': 3, 'wrinkles': 3, 'pores': 3},
+}
+
+ROUTINE_STEPS = [
+    ('Очищение', 'Мягкий гель для умывания', 2),
+    ('Тонизирование', 'Тоник с гиалуроновой кислотой', 1),
+    ('Сыворотка', 'Сыворотка с витамином С', 1),
+    ('Увлажнение', 'Увлажняющий крем', 2),
+    ('Защита', 'Солнцезащитный крем SPF 50', 1),
+    ('Маска', 'Глиняная маска', 15),
+]
+
+
+def clamp(value):
+    return max(1, min(10, value))
+
+
+def clamp_age(value):
+    return max(14, min(75, int(value)))
+
+
+def count_around(rng, mean):
+    """Gamma-distributed per-user count (shape 4): most users near the mean, a tail of heavy users."""
+    if mean <= 0:
+        return 0
+    return min(round(rng.gammavariate(4, mean / 4)), mean * 10)
+
+
+def build_user(rng, username, password_hash):
+    User = get_user_model()
+    return User(
+        username=username,
+        email=f'{username}@example.com',
+        password=password_hash,
+        skin_type=rng.choices(SKIN_TYPES, SKIN_TYPE_WEIGHTS)[0],
+        age=clamp_age(rng.gauss(30, 9)),
+        lifestyle=rng.choice(LIFESTYLES),
+        skin_concerns=', '.join(rng.sample(CONCERNS, rng.randint(1, 3))),
+    )
+
+
+def generate_chunk(rng, users, args, article_ids, tag):
+    """Insert all related rows for one chunk of saved users. Returns row counts by table."""
+    today = date.today()
+    counts = dict.fromkeys(
+        ['entries', 'metrics', 'quiz', 'routines', 'routine_steps', 'sessions', 'messages', 'favorites'], 0)
+
+    entries = []
+    for user in users:
+        day = today - timedelta(days=rng.randint(0, 30))
+        for _ in range(count_around(rng, args.entries)):
+            entries.append(ProgressEntry(
+                user=user, date=day,
+                skin_condition=rng.choices(SKIN_CONDITIONS, SKIN_CONDITION_WEIGHTS)[0],
+            ))
+            # Users log most days with occasional gaps
+            day -= timedelta(days=1 + int(rng.expovariate(1.5)))
+    entries = ProgressEntry.objects.bulk_create(entries, batch_size=BATCH_SIZE)
+    counts['entries'] = len(entries)
+
+    skin_types = {user.pk: user.skin_type for user in users}
+    metrics = [
+        SkinMetric(entry=entry, metric_type=metric_type, unit=unit,
+                   value=clamp(round(rng.gauss(METRIC_BASELINES[skin_types[entry.user_id]][metric_type], 1.5))))
+        for entry in entries
+        for metric_type, unit in METRIC_UNITS.items()
+    ]
+    SkinMetric.objects.bulk_create(metrics, batch_size=BATCH_SIZE)
+    counts['metrics'] = len(metrics)
+
+    quiz_results = [
+        QuizResult(
+            user=user,
+            skin_type=user.skin_type,
+            confidence_score=round(rng.betavariate(8, 2), 3),
+            answers={str(q): rng.randint(0, 3) for q in range(1, 8)},
+        )
+        for user in users
+        for _ in range(1 + (rng.random() < 0.2))
+    ]
+    QuizResult.objects.bulk_create(quiz_results, batch_size=BATCH_SIZE)
+    counts['quiz'] = len(quiz_results)
+
+    routines = []
+    for user in users:
+        for n in range(count_around(rng, args.routines)):
+            chosen = ROUTINE_STEPS[:rng.randint(3, len(ROUTINE_STEPS))]
+            steps = [
+                {'step_number': i, 'step_name': name, 'product': product,
+                 'instructions': 'Нанести на чистую кожу.', 'duration_minutes': minutes}
+                for i, (name, product, minutes) in enumerate(chosen, start=1)
+            ]
+            routines.append(Routine(
+                user=user, name=f'Рутина {n + 1}', routine_type=rng.choice(['morning', 'evening', 'weekly']),
+                products=[step['product'] for step in steps], steps=steps,
+                is_ai_generated=rng.random() < 0.7,
+            ))
+    routines = Routine.objects.bulk_create(routines, batch_size=BATCH_SIZE)
+    counts['routines'] = len(routines)
+
+    # Keep routines_routinestep in step with the steps JSON, as the app does
+    routine_steps = [
+        RoutineStep(routine=routine, step_number=step['step_number'], step_name=step['step_name'],
+                    product=step['product'], instructions=step['instructions'],
+                    duration_minutes=step['duration_minutes'])
+        for routine in routines
+        for step in routine.steps
+    ]
+    RoutineStep.objects.bulk_create(routine_steps, batch_size=BATCH_SIZE)
+    counts['routine_steps'] = len(routine_steps)
+
+    sessions = []
+    message_counts = []
+    for user in users:
+        n_messages = count_around(rng, args.messages)
+        if n_messages:
+            sessions.append(ChatSession(user=user, session_id=f'load-{tag}-{user.pk}', title='Чат'))
+            message_counts.append(n_messages)
+    sessions = ChatSession.objects.bulk_create(sessions, batch_size=BATCH_SIZE)
+    messages = [
+        ChatMessage(session=session, message_type='user' if n % 2 == 0 else 'bot',
+                    content=f'Сообщение {n + 1}')
+        for session, n_messages in zip(sessions, message_counts)
+        for n in range(n_messages)
+    ]
+    ChatMessage.objects.bulk_create(messages, batch_size=BATCH_SIZE)
+    counts['sessions'] = len(sessions)
+    counts['messages'] = len(messages)
+
+    if article_ids:
+        favorites = [
+            UserFavorite(user=user, article_id=article_id)
+            for user in users
+            for article_id in rng.sample(article_ids, min(count_around(rng, args.favorites), len(article_ids)))
+        ]
+        UserFavorite.objects.bulk_create(favorites, batch_size=BATCH_SIZE)
+        counts['favorites'] = len(favorites)
+
+    return counts
+
+
+def generate_load_data(args):
+    print(f"🌱 Generating load data for {args.users} users...")
+    rng = random.Random(args.seed)
+    User = get_user_model()
+    # Hashing once keeps PBKDF2 out of the per-user cost; every load user shares the password
+    password_hash = make_password('loadtest123')
+    article_ids = list(Article.objects.values_list('id', flat=True))
+    tag = int(time.time())
+
+    totals = {}
+    start = time.perf_counter()
+    for offset in range(0, args.users, args.chunk_size):
+        size = min(args.chunk_size, args.users - offset)
+        with transaction.atomic():
+            users = User.objects.bulk_create(
+                [build_user(rng, f'load_{tag}_{offset + n}', password_hash) for n in range(size)],
+                batch_size=BATCH_SIZE,
+            )
+            counts = generate_chunk(rng, users, args, article_ids, tag)
+        counts['users'] = len(users)
+        for table, count in counts.items():
+            totals[table] = totals.get(table, 0) + count
+
+        elapsed = time.perf_counter() - start
+        rows = sum(totals.values())
+        print(f"  {offset + size}/{args.users} users, {rows} rows, {rows / elapsed:.0f} rows/s")
+
+    elapsed = time.perf_counter() - start
+    rows = sum(totals.values())
+    print(f"\n✅ Created {rows} rows in {elapsed:.1f}s ({rows / elapsed:.0f} rows/s)")
+    for table, count in totals.items():
+        print(f"   {table}: {count}")
+    if not article_ids:
+        print("ℹ️ No articles found, favorites skipped (run populate_articles.py first)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic load-test data")
+    parser.add_argument('--users', type=positive_int, default=10000)
+    parser.add_argument('--chunk-size', type=positive_int, default=1000, help="Users per transaction")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--entries', type=int, default=60, help="Mean tracker entries per user")
+    parser.add_argument('--messages', type=int, default=20, help="Mean chat messages per user")
+    parser.add_argument('--routines', type=int, default=2, help="Mean routines per user")
+    parser.add_argument('--favorites', type=int, default=3, help="Mean favorite articles per user")
+    generate_load_data(parser.parse_args())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+"""
+Multi-process SQLite write-contention benchmark.
+
+Runs several worker processes that insert rows concurrently (like gunicorn workers
+saving chat messages and tracker entries) against a scratch database, once with
+SQLite defaults and once with the production profile below, and reports
+throughput, latency and "database is locked" errors for each.
+
+The production profile maps to Django 5.1+ settings as:
+
+    DATABASES['default']['OPTIONS'] = {
+        'transaction_mode': 'IMMEDIATE',
+        'timeout': 20,
+        'init_command': (
+            'PRAGMA journal_mode=WAL;'
+            'PRAGMA synchronous=NORMAL;'
+            'PRAGMA busy_timeout=20000;'
+            'PRAGMA mmap_size=134217728;'
+            'PRAGMA cache_size=-20000;'
+        ),
+    }
+
+Usage:
+    python sqlite_write_benchmark.py [--workers 4] [--writes 500] [--rows 3]
+"""
+
+import os
+import time
+import sqlite3
+import argparse
+import tempfile
+import statistics
+from multiprocessing import Pool
+
+PRODUCTION_PRAGMAS = [
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA busy_timeout=20000',
+    'PRAGMA mmap_size=134217728',
+    'PRAGMA cache_size=-20000',
+]
+
+PROFILES = {
+    # Django's defaults: rollback journal, deferred transactions, 5s timeout
+    'default': {'pragmas': [], 'begin': 'BEGIN', 'timeout': 5},
+    'production': {'pragmas': PRODUCTION_PRAGMAS, 'begin': 'BEGIN IMMEDIATE', 'timeout': 20},
+}
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS chatbot_chatmessage (
+    id integer NOT NULL PRIMARY KEY AUTOINCREMENT,
+    message_type varchar(10) NOT NULL,
+    content text NOT NULL,
+    timestamp datetime NOT NULL,
+    session_id bigint NOT NULL
+)
+'''
+
+
+def connect(path, profile):
+    conn = sqlite3.connect(path, timeout=profile['timeout'], isolation_level=None)
+    for pragma in profile['pragmas']:
+        conn.execute(pragma)
+    return conn
+
+
+def worker(args):
+    path, profile_name, worker_id, writes, rows = args
+    profile = PROFILES[profile_name]
+    conn = connect(path, profile)
+    latencies = []
+    errors = 0
+
+    for i in range(writes):
+        start = time.perf_counter()
+        try:
+            # Read-then-write, like a view that loads the session before saving a message
+            conn.execute(profile['begin'])
+            conn.execute('SELECT COUNT(*) FROM chatbot_chatmessage WHERE session_id = ?', (worker_id,)).fetchone()
+            conn.executemany(
+                'INSERT INTO chatbot_chatmessage (message_type, content, timestamp, session_id) '
+                'VALUES (?, ?, datetime(\'now\'), ?)',
+                [('user', f'message {i}-{n}', worker_id) for n in range(rows)],
+            )
+            conn.execute('COMMIT')
+            latencies.append(time.perf_counter() - start)
+        except sqlite3.OperationalError:
+            errors += 1
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+
+    conn.close()
+    return latencies, errors
+
+
+def run_profile(profile_name, workers, writes, rows):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.sqlite3')
+        conn = connect(path, PROFILES[profile_name])
+        conn.execute(SCHEMA)
+        conn.close()
+
+        start = time.perf_counter()
+        with Pool(workers) as pool:
+            results = pool.map(worker, [(path, profile_name, w, writes, rows) for w in range(workers)])
+        elapsed = time.perf_counter() - start
+
+    latencies = sorted(lat for lats, _ in results for lat in lats)
+    errors = sum(err for _, err in results)
+    return {
+        'committed': len(latencies),
+        'errors': errors,
+        'tps': len(latencies) / elapsed,
+        'p50_ms': statistics.median(latencies) * 1000 if latencies else 0.0,
+        'p99_ms': latencies[int(len(latencies) * 0.99) - 1] * 1000 if latencies else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite write-contention benchmark")
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--writes', type=int, default=500, help="Transactions per worker")
+    parser.add_argument('--rows', type=int, default=3, help="Rows inserted per transaction")
+    args = parser.parse_args()
+
+    print(f"🧪 SQLite write contention: {args.workers} workers × {args.writes} transactions")
+    print(f"{'profile':<12}{'committed':>10}{'locked':>8}{'tx/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for profile_name in PROFILES:
+        result = run_profile(profile_name, args.workers, args.writes, args.rows)
+        print(f"{profile_name:<12}{result['committed']:>10}{result['errors']:>8}"
+              f"{result['tps']:>10.0f}{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -13,22 +13,24 @@ echo "Python path: $PYTHONPATH"
 echo "Files in current directory:"
 ls -la
 
-# Collect static files
-echo "Collecting static files..."
-python manage.py collectstatic --noinput --clear
-
-# Apply database migrations
-echo "Applying database migrations..."
-python manage.py migrate --noinput
-
-# Create superuser if not exists
-echo "Checking for superuser..."
+# Collect static files, apply migrations and ensure the superuser in one Python
+# process, so Django is only set up once before Gunicorn starts
+echo "Preparing Django (static files, migrations, superuser)..."
 python -c "
 import os
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'skincare_ai.settings')
 import django
 django.setup()
+from django.core.management import call_command
 from django.contrib.auth import get_user_model
+
+print('Collecting static files...')
+call_command('collectstatic', interactive=False, verbosity=0)
+
+print('Applying database migrations...')
+call_command('migrate', interactive=False)
+
+print('Checking for superuser...')
 User = get_user_model()
 try:
     if not User.objects.filter(username=os.getenv('DJANGO_SUPERUSER_USERNAME', 'admin')).exists():
@@ -41,14 +43,15 @@ try:
     else:
         print('Superuser already exists')
 except Exception as e:
-    print(f'Error creating superuser: {e}'
-)"
+    print(f'Error creating superuser: {e}')
+"
 
 # Start Gunicorn
 echo "Starting Gunicorn..."
-exec gunicorn skincare_ai.wsgi:application \
+exec gunicorn wsgi_preload:application \
     --bind 0.0.0.0:${PORT:-10000} \
     --workers 3 \
+    --preload \
     --pythonpath $PWD \
     --log-file - \
     --timeout 120 \
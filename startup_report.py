@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+"""
+Startup-time report for SkinCare AI workers.
+
+Runs a fresh interpreter (like a newly started gunicorn worker) several times and
+reports how long django.setup(), loading the WSGI application from wsgi_preload
+(including the URLconf warm-up) and the first and second requests take, plus the
+slowest top-level imports from `python -X importtime`. The test client is imported
+outside the timed phases, so its cost is not counted as worker startup.
+
+Usage:
+    python startup_report.py [--runs 5] [--url /] [--top 15]
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+PROBE = r'''
+import json, os, sys, time
+t0 = time.perf_counter()
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'skincare_ai.settings')
+import django
+django.setup()
+t1 = time.perf_counter()
+from wsgi_preload import application
+t2 = time.perf_counter()
+# Counted before the test client is imported, which a real worker never loads
+modules_loaded = len(sys.modules)
+from django.conf import settings
+from django.test import Client
+if 'testserver' not in settings.ALLOWED_HOSTS:
+    settings.ALLOWED_HOSTS.append('testserver')
+client = Client()
+t3 = time.perf_counter()
+client.get(sys.argv[1])
+t4 = time.perf_counter()
+client.get(sys.argv[1])
+t5 = time.perf_counter()
+print(json.dumps({
+    'django_setup_ms': (t1 - t0) * 1000,
+    'wsgi_load_ms': (t2 - t1) * 1000,
+    'first_request_ms': (t4 - t3) * 1000,
+    'second_request_ms': (t5 - t4) * 1000,
+    'modules_loaded': modules_loaded,
+}))
+'''
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def run_probe(url):
+    result = subprocess.run([sys.executable, '-c', PROBE, url], capture_output=True, text=True,
+                            cwd=BASE_DIR, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def slowest_imports(top):
+    """Return (cumulative_ms, module) for the slowest top-level imports while loading the app."""
+    snippet = ("import os; os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'skincare_ai.settings'); "
+               "import django; django.setup(); from wsgi_preload import application")
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', snippet], capture_output=True,
+                            text=True, cwd=BASE_DIR, check=True)
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if not cumulative.strip().isdigit():
+            continue
+        # Only top-level entries (no indentation) so nested imports are not double counted
+        if name.startswith(' ') and not name.startswith('  '):
+            imports.append((int(cumulative) / 1000, name.strip()))
+    return sorted(imports, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report worker startup and first-request latency")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--url', default='/')
+    parser.add_argument('--top', type=int, default=15, help="Slowest imports to list")
+    args = parser.parse_args()
+
+    print(f"🧪 Measuring cold startup over {args.runs} runs...")
+    runs = [run_probe(args.url) for _ in range(args.runs)]
+
+    print(f"\n{'phase':<20}{'median ms':>12}{'min ms':>10}{'max ms':>10}")
+    for key in ['django_setup_ms', 'wsgi_load_ms', 'first_request_ms', 'second_request_ms']:
+        values = [run[key] for run in runs]
+        print(f"{key[:-3]:<20}{statistics.median(values):>12.1f}{min(values):>10.1f}{max(values):>10.1f}")
+    print(f"{'modules loaded':<20}{runs[-1]['modules_loaded']:>12}")
+
+    print(f"\n{'slowest imports':<40}{'cumulative ms':>14}")
+    for cumulative_ms, name in slowest_imports(args.top):
+        print(f"{name:<40}{cumulative_ms:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+"""
+Normalize Routine.steps JSON and rebuild the RoutineStep rows from it.
+
+Routine.steps and routines_routinestep hold the same data and drift apart; some steps
+also store duration_minutes as a string ("10"), which breaks the total_time sum on
+/routines/. This script treats the JSON as the source of truth, coerces durations to
+integers and rewrites RoutineStep rows only for routines whose rows differ. Routines
+whose JSON cannot be normalized without losing data (non-object steps, durations like
+"5-10", empty steps with existing rows) are reported and left untouched.
+
+Usage:
+    python sync_routine_steps.py [--dry-run]
+"""
+
+import os
+import sys
+import django
+
+# Setup Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'skincare_ai.settings')
+django.setup()
+
+from django.db import transaction
+from routines.models import Routine, RoutineStep
+
+CHUNK_SIZE = 500
+
+
+def to_int(value):
+    """Return value as a non-negative int, None if missing, or raise ValueError."""
+    if value in (None, ''):
+        return None
+    if isinstance(value, bool):
+        raise ValueError(repr(value))
+    if isinstance(value, int):
+        number = value
+    elif isinstance(value, str):
+        number = int(value.strip())
+    else:
+        raise ValueError(repr(value))
+    if number < 0:
+        raise ValueError(repr(value))
+    return number
+
+
+def normalize_steps(steps):
+    """
+    Return (steps, problems): steps as dicts with int step_number/duration_minutes, and a
+    list of reasons the JSON cannot be normalized without losing data.
+    """
+    if not isinstance(steps, list):
+        return [], [f"steps is {type(steps).__name__}, not a list"] if steps is not None else []
+
+    normalized = []
+    problems = []
+    for index, step in enumerate(steps, start=1):
+        if not isinstance(step, dict):
+            problems.append(f"step {index} is not an object: {step!r}")
+            continue
+        step = dict(step)
+        try:
+            step_number = to_int(step.get('step_number'))
+            step['step_number'] = index if step_number is None else step_number
+        except ValueError:
+            problems.append(f"step {index} has step_number {step.get('step_number')!r}")
+            continue
+        try:
+            step['duration_minutes'] = to_int(step.get('duration_minutes')) or 0
+        except ValueError:
+            problems.append(f"step {index} has duration_minutes {step.get('duration_minutes')!r}")
+            continue
+        normalized.append(step)
+
+    numbers = [step['step_number'] for step in normalized]
+    duplicates = sorted({number for number in numbers if numbers.count(number) > 1})
+    if duplicates:
+        problems.append(f"duplicate step_number {', '.join(map(str, duplicates))}")
+    return normalized, problems
+
+
+def step_key(step):
+    return (
+        step['step_number'],
+        step.get('step_name') or '',
+        step.get('product') or '',
+        step.get('instructions') or '',
+        step['duration_minutes'],
+    )
+
+
+def sync_routine_steps(dry_run=False):
+    print("🔄 Syncing routine steps...")
+
+    # One query for all existing rows, keyed by routine
+    rows_by_routine = {}
+    for row in RoutineStep.objects.order_by('routine_id', 'step_number', 'id').values(
+            'routine_id', 'step_number', 'step_name', 'product', 'instructions', 'duration_minutes'):
+        row['duration_minutes'] = row['duration_minutes'] or 0
+        rows_by_routine.setdefault(row['routine_id'], []).append(step_key(row))
+
+    fixed_json = rebuilt = skipped = 0
+    for routine in Routine.objects.only('id', 'steps').iterator(chunk_size=CHUNK_SIZE):
+        steps, problems = normalize_steps(routine.steps)
+        if not steps and rows_by_routine.get(routine.id):
+            problems.append("steps JSON is empty but step rows exist")
+        if problems:
+            # Leave the routine untouched; rewriting it would lose data
+            print(f"⚠️ Skipping routine {routine.id}: {'; '.join(problems)}")
+            skipped += 1
+            continue
+
+        json_changed = steps != routine.steps
+        # Compare as sorted keys: JSON list order is the app's display order and is left
+        # alone, so only the content decides whether rows need rebuilding
+        rows_changed = sorted(step_key(step) for step in steps) != sorted(rows_by_routine.get(routine.id, []))
+        if not (json_changed or rows_changed):
+            continue
+
+        print(f"{'Would fix' if dry_run else 'Fixing'} routine {routine.id}"
+              f"{' (steps JSON)' if json_changed else ''}{' (step rows)' if rows_changed else ''}")
+        if dry_run:
+            fixed_json += json_changed
+            rebuilt += rows_changed
+            continue
+
+        with transaction.atomic():
+            if json_changed:
+                Routine.objects.filter(pk=routine.pk).update(steps=steps)
+                fixed_json += 1
+            if rows_changed:
+                RoutineStep.objects.filter(routine_id=routine.id).delete()
+                RoutineStep.objects.bulk_create([
+                    RoutineStep(
+                        routine_id=routine.id,
+                        step_number=step['step_number'],
+                        step_name=step.get('step_name') or '',
+                        product=step.get('product') or None,
+                        instructions=step.get('instructions') or '',
+                        duration_minutes=step['duration_minutes'],
+                    )
+                    for step in steps
+                ])
+                rebuilt += 1
+
+    print(f"\n✅ Steps JSON normalized: {fixed_json}")
+    print(f"✅ Step rows rebuilt: {rebuilt}")
+    if skipped:
+        print(f"⚠️ Routines skipped for manual review: {skipped}")
+
+
+if __name__ == '__main__':
+    sync_routine_steps(dry_run='--dry-run' in sys.argv)
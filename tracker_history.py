@@ -0,0 +1,288 @@
+#!/usr/bin/env python
+"""
+Export and import a user's tracker history (ProgressEntry + SkinMetric) as CSV or JSON Lines.
+
+Both directions stream: export walks server-side cursors with .iterator(chunk_size=...)
+and import inserts in fixed-size batches, so memory stays flat for years of entries.
+
+Usage:
+    python tracker_history.py export <username> [--format csv|json] [--output FILE]
+    python tracker_history.py import <username> <FILE> [--format csv|json] [--batch-size N]
+"""
+
+import os
+import sys
+import csv
+import json
+import argparse
+import django
+
+# Setup Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'skincare_ai.settings')
+django.setup()
+
+from datetime import date
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from tracker.models import ProgressEntry, SkinMetric
+
+CHUNK_SIZE = 2000
+BATCH_SIZE = 500
+
+# Metric types and units exactly as the tracker form stores them
+METRIC_UNITS = {
+    'hydration': 'Увлажненность',
+    'oiliness': 'Жирность',
+    'redness': 'Покраснение',
+    'acne': 'Акне',
+    'wrinkles': 'Морщины',
+    'pores': 'Поры',
+}
+METRIC_TYPES = list(METRIC_UNITS)
+MIN_VALUE, MAX_VALUE = 0, 10
+
+FIELDNAMES = ['date', 'skin_condition', 'notes'] + METRIC_TYPES
+
+
+class Echo:
+    """File-like object whose write() returns the line, for csv.writer in generators."""
+
+    def write(self, value):
+        return value
+
+
+def positive_int(value):
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def _field_choices(model, field_name):
+    choices = model._meta.get_field(field_name).choices
+    return {value for value, _ in choices} if choices else None
+
+
+def iter_history(user):
+    """Yield one dict per ProgressEntry with its metrics flattened into columns."""
+    entries = (ProgressEntry.objects.filter(user=user)
+               .order_by('date', 'id')
+               .values('id', 'date', 'skin_condition', 'notes')
+               .iterator(chunk_size=CHUNK_SIZE))
+    metrics = (SkinMetric.objects.filter(entry__user=user)
+               .order_by('entry__date', 'entry_id')
+               .values_list('entry_id', 'metric_type', 'value')
+               .iterator(chunk_size=CHUNK_SIZE))
+
+    # Both cursors are ordered the same way, so a merge join keeps only one entry in memory
+    pending = next(metrics, None)
+    for entry in entries:
+        row = {
+            'date': entry['date'].isoformat(),
+            'skin_condition': entry['skin_condition'],
+            'notes': entry['notes'] or '',
+        }
+        row.update({metric_type: None for metric_type in METRIC_TYPES})
+        while pending is not None and pending[0] == entry['id']:
+            if pending[1] in METRIC_UNITS:
+                row[pending[1]] = pending[2]
+            pending = next(metrics, None)
+        yield row
+
+
+def iter_csv(user):
+    """Yield CSV lines; suitable for StreamingHttpResponse."""
+    writer = csv.DictWriter(Echo(), fieldnames=FIELDNAMES)
+    yield writer.writeheader()
+    for row in iter_history(user):
+        yield writer.writerow(row)
+
+
+def iter_json_lines(user):
+    """Yield JSON Lines; suitable for StreamingHttpResponse."""
+    for row in iter_history(user):
+        yield json.dumps(row, ensure_ascii=False) + '\n'
+
+
+def _parse_int(raw):
+    """Return raw as an int if it is a real integer or an integral string, else None."""
+    if isinstance(raw, bool):
+        return None
+    if isinstance(raw, int):
+        return raw
+    if isinstance(raw, str):
+        try:
+            return int(raw.strip())
+        except ValueError:
+            return None
+    return None
+
+
+def parse_row(row, allowed_conditions):
+    """Validate one imported row and return (date, skin_condition, notes, {metric: value})."""
+    try:
+        entry_date = date.fromisoformat(str(row.get('date', '')).strip())
+    except ValueError:
+        raise ValueError(f"invalid date: {row.get('date')!r}")
+
+    skin_condition = str(row.get('skin_condition') or '').strip()
+    if not skin_condition:
+        raise ValueError("skin_condition is required")
+    if allowed_conditions is not None and skin_condition not in allowed_conditions:
+        raise ValueError(f"unknown skin_condition: {skin_condition!r}")
+
+    if None in row:
+        raise ValueError("extra columns without a header")
+    unknown = set(row) - set(FIELDNAMES)
+    if unknown:
+        raise ValueError(f"unknown columns: {', '.join(sorted(unknown))} "
+                         f"(expected header: {','.join(FIELDNAMES)})")
+
+    metrics = {}
+    for metric_type in METRIC_TYPES:
+        raw = row.get(metric_type)
+        if raw in (None, ''):
+            continue
+        value = _parse_int(raw)
+        if value is None:
+            raise ValueError(f"{metric_type} must be an integer, got {raw!r}")
+        if not MIN_VALUE <= value <= MAX_VALUE:
+            raise ValueError(f"{metric_type} must be between {MIN_VALUE} and {MAX_VALUE}, got {value}")
+        metrics[metric_type] = value
+
+    return entry_date, skin_condition, str(row.get('notes') or '').strip(), metrics
+
+
+def _read_rows(stream, fmt):
+    """Yield (line_no, raw_row); JSON lines are left undecoded so errors stay per row."""
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+    else:
+        for line_no, line in enumerate(stream, start=1):
+            if line.strip():
+                yield line_no, line
+
+
+def _decode_row(raw, fmt):
+    if fmt == 'csv':
+        return raw
+    try:
+        row = json.loads(raw)
+    except ValueError as e:
+        raise ValueError(f"invalid JSON: {e}")
+    if not isinstance(row, dict):
+        raise ValueError(f"expected a JSON object, got {type(row).__name__}")
+    return row
+
+
+def _flush(user, batch):
+    """Insert one batch of parsed rows, skipping dates the user already has."""
+    existing = set(ProgressEntry.objects.filter(
+        user=user, date__in=[item[0] for item in batch]
+    ).values_list('date', flat=True))
+    batch = [item for item in batch if item[0] not in existing]
+    if not batch:
+        return 0, len(existing)
+
+    with transaction.atomic():
+        entries = ProgressEntry.objects.bulk_create([
+            ProgressEntry(user=user, date=entry_date, skin_condition=skin_condition, notes=notes)
+            for entry_date, skin_condition, notes, _ in batch
+        ])
+        SkinMetric.objects.bulk_create([
+            SkinMetric(entry=entry, metric_type=metric_type, value=value, unit=METRIC_UNITS[metric_type])
+            for entry, (_, _, _, metrics) in zip(entries, batch)
+            for metric_type, value in metrics.items()
+        ])
+    return len(batch), len(existing)
+
+
+def import_history(user, stream, fmt='csv', batch_size=BATCH_SIZE, on_error=None):
+    """
+    Validate and insert rows from stream in batches. Each rejected row is passed to
+    on_error(message) as it is read rather than collected, so memory stays flat on large
+    malformed files. Returns (created, skipped, rejected).
+    """
+    allowed_conditions = _field_choices(ProgressEntry, 'skin_condition')
+    created = skipped = rejected = 0
+    batch = []
+    seen_dates = set()
+
+    for line_no, raw in _read_rows(stream, fmt):
+        try:
+            parsed = parse_row(_decode_row(raw, fmt), allowed_conditions)
+        except ValueError as e:
+            error = f"line {line_no}: {e}"
+        else:
+            error = f"line {line_no}: duplicate date {parsed[0].isoformat()}" if parsed[0] in seen_dates else None
+        if error:
+            rejected += 1
+            if on_error:
+                on_error(error)
+            continue
+        seen_dates.add(parsed[0])
+        batch.append(parsed)
+
+        if len(batch) >= batch_size:
+            batch_created, batch_skipped = _flush(user, batch)
+            created += batch_created
+            skipped += batch_skipped
+            batch = []
+
+    if batch:
+        batch_created, batch_skipped = _flush(user, batch)
+        created += batch_created
+        skipped += batch_skipped
+
+    return created, skipped, rejected
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export or import tracker history")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    export_parser = subparsers.add_parser('export')
+    export_parser.add_argument('username')
+    export_parser.add_argument('--format', choices=['csv', 'json'], default='csv')
+    export_parser.add_argument('--output', help="File to write (default: stdout)")
+
+    import_parser = subparsers.add_parser('import')
+    import_parser.add_argument('username')
+    import_parser.add_argument('file')
+    import_parser.add_argument('--format', choices=['csv', 'json'], default='csv')
+    import_parser.add_argument('--batch-size', type=positive_int, default=BATCH_SIZE)
+
+    args = parser.parse_args()
+
+    User = get_user_model()
+    try:
+        user = User.objects.get(username=args.username)
+    except User.DoesNotExist:
+        print(f"❌ User not found: {args.username}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.command == 'export':
+        chunks = iter_csv(user) if args.format == 'csv' else iter_json_lines(user)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8', newline='') as f:
+                f.writelines(chunks)
+            print(f"✅ Tracker history exported to {args.output}", file=sys.stderr)
+        else:
+            sys.stdout.writelines(chunks)
+    else:
+        # utf-8-sig strips the BOM that Excel's "CSV UTF-8" export writes
+        with open(args.file, encoding='utf-8-sig', newline='') as f:
+            created, skipped, rejected = import_history(
+                user, f, args.format, args.batch_size,
+                on_error=lambda error: print(f"❌ {error}", file=sys.stderr),
+            )
+        print(f"✅ Imported {created} entries ({skipped} existing dates skipped, {rejected} rows rejected)",
+              file=sys.stderr)
+        if rejected:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
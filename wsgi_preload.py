@@ -0,0 +1,25 @@
+"""
+WSGI entry point for running gunicorn with --preload.
+
+Wraps the project's skincare_ai.wsgi:application unchanged, so anything that module
+sets up still applies, and then imports the root URLconf. Django otherwise imports the
+URLconf, every app's views and the libraries they pull in (OpenAI SDK, Pillow, DRF)
+lazily on the first request, which under --preload would happen in each worker after
+the fork. Loading them here, in the gunicorn master, lets forked workers share those
+pages copy-on-write.
+
+    gunicorn wsgi_preload:application --preload
+"""
+
+from django.db import connections
+from django.urls import get_resolver
+
+from skincare_ai.wsgi import application
+
+# Import the root URLconf and, through it, every view module
+get_resolver().url_patterns
+
+# Never hand a connection opened in the master to forked workers
+connections.close_all()
+
+__all__ = ['application']